@@ -4,9 +4,11 @@ Module for configuring and initializing the Anthropic model.
 
 import os
 
+import anthropic
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
 
+from src.utils.http_transport import http_async_client, http_client
 from src.utils.rate_limiting import rate_limiter
 
 load_dotenv()
@@ -24,3 +26,14 @@ anthropic_model = init_chat_model(
     rate_limiter=rate_limiter,
     max_retries=5,
 )
+
+# ChatAnthropic has no option for custom HTTP clients, so its SDK clients are rebuilt on the shared pools.
+# A configured proxy is applied by ChatAnthropic's own HTTP clients, which are kept in that case.
+if not anthropic_model.anthropic_proxy:
+    anthropic_client_params = anthropic_model._client_params  # pylint: disable=protected-access
+    anthropic_model._client = anthropic.Client(  # pylint: disable=protected-access
+        **anthropic_client_params, http_client=http_client
+    )
+    anthropic_model._async_client = anthropic.AsyncClient(  # pylint: disable=protected-access
+        **anthropic_client_params, http_client=http_async_client
+    )
@@ -4,9 +4,11 @@ Module for configuring and initializing the Cohere model.
 
 import os
 
+import cohere
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
 
+from src.utils.http_transport import http_async_client, http_client
 from src.utils.rate_limiting import rate_limiter
 
 load_dotenv()
@@ -24,3 +26,13 @@ cohere_model = init_chat_model(
     rate_limiter=rate_limiter,
     max_retries=5,
 )
+
+# ChatCohere has no option for custom HTTP clients, so its SDK clients are rebuilt on the shared pools
+cohere_client_params = {
+    "api_key": cohere_api_key,
+    "client_name": cohere_model.user_agent,
+    "timeout": cohere_model.timeout_seconds,
+    "base_url": cohere_model.base_url,
+}
+cohere_model.client = cohere.Client(**cohere_client_params, httpx_client=http_client)
+cohere_model.async_client = cohere.AsyncClient(**cohere_client_params, httpx_client=http_async_client)
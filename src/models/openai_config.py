@@ -7,6 +7,7 @@ import os
 from dotenv import load_dotenv
 from langchain.chat_models import init_chat_model
 
+from src.utils.http_transport import http_async_client, http_client
 from src.utils.rate_limiting import rate_limiter
 
 load_dotenv()
@@ -23,4 +24,6 @@ openai_model = init_chat_model(
     openai_api_key=openai_api_key,
     rate_limiter=rate_limiter,
     max_retries=5,
+    http_client=http_client,
+    http_async_client=http_async_client,
 )
@@ -8,6 +8,23 @@ import textwrap
 from langchain.schema import HumanMessage
 
 from src.models.model_manager import ModelManager
+from src.processors.text_normalizer import NormalizationStats, TextNormalizer
+from src.utils.http_transport import transport_loop
+
+
+class SummaryResult:
+    # pylint: disable=too-few-public-methods
+    """A generated summary together with the normalization savings of its input."""
+
+    def __init__(self, summary: str, normalization: NormalizationStats, timed_out_chunks: int = 0):
+        self.summary = summary
+        self.normalization = normalization
+        self.timed_out_chunks = timed_out_chunks  # Chunks replaced by a "[Partial Result - Timeout ...]" marker
+
+    @property
+    def partial(self) -> bool:
+        """Whether part of the summary is a timeout marker rather than model output."""
+        return self.timed_out_chunks > 0
 
 
 class SummaryGenerator:
@@ -20,17 +37,29 @@ class SummaryGenerator:
     - bullet: A bullet point summary
     """
 
-    def __init__(self, model_manager: ModelManager, chunk_size: int = 4000, timeout: int = 30):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        chunk_size: int = 4000,
+        timeout: int = 30,
+        normalizer: TextNormalizer | None = None,
+    ):
         """Initialize SummaryGenerator with ModelManager and configuration."""
         self.model_manager = model_manager
         self.chunk_size = chunk_size  # Max characters per chunk
-        self.timeout = timeout  # Seconds before timeout
+        self.timeout = timeout  # Seconds before a chunk, including the only chunk of a short text, times out
+        self.normalizer = normalizer or TextNormalizer()  # Compacts text before chunking
         self.summary_types = {
             "brief": "Provide a concise summary (2-3 sentences)",
             "detailed": "Provide a detailed summary with key points",
             "bullet": "Provide a summary in bullet point format",
         }
 
+    def _prepare_chunks(self, text: str) -> tuple[list[str], NormalizationStats]:
+        """Normalize the text and split it into chunks."""
+        text, stats = self.normalizer.normalize(text)
+        return self._chunk_text(text), stats
+
     def _chunk_text(self, text: str) -> list[str]:
         """Split text into manageable chunks."""
         if len(text) <= self.chunk_size:
@@ -60,54 +89,90 @@ class SummaryGenerator:
 
         return chunks
 
-    async def _summarize_chunk(self, chunk: str, summary_type: str) -> str:
-        """Summarize a single chunk with timeout handling."""
+    async def _invoke_chunk(self, chunk: str, summary_type: str) -> str:
+        """Summarize a single chunk, raising asyncio.TimeoutError when the model is too slow."""
         prompt = f"{self.summary_types[summary_type]}:\n\n{chunk}"
+        response = await asyncio.wait_for(
+            self.model_manager.default_client.ainvoke([HumanMessage(content=prompt)]),
+            timeout=self.timeout,  # pylint: disable=line-too-long  # "black" is reformatting these lines
+        )
+        return str(response.content)
+
+    def _timeout_placeholder(self, chunk: str) -> str:
+        """Stand-in for the summary of a chunk that timed out."""
+        return (
+            f"[Partial Result - Timeout after {self.timeout}s]: "
+            f"{textwrap.shorten(chunk, width=100, placeholder='...')}"  # pylint: disable=line-too-long  # "black" is reformatting these lines
+        )
 
+    async def _summarize_chunk(self, chunk: str, summary_type: str) -> str:
+        """Summarize a single chunk with timeout handling."""
         try:
-            response = await asyncio.wait_for(
-                self.model_manager.default_client.ainvoke([HumanMessage(content=prompt)]),
-                timeout=self.timeout,  # pylint: disable=line-too-long  # "black" is reformatting these lines
-            )
-            return str(response.content)
+            return await self._invoke_chunk(chunk, summary_type)
         except asyncio.TimeoutError:
-            return (
-                f"[Partial Result - Timeout after {self.timeout}s]: "
-                f"{textwrap.shorten(chunk, width=100, placeholder='...')}"  # pylint: disable=line-too-long  # "black" is reformatting these lines
-            )
+            return self._timeout_placeholder(chunk)
 
     async def _summarize_chunks(self, chunks: list[str], summary_type: str) -> list[str]:
         """Process all chunks concurrently."""
         tasks = [self._summarize_chunk(chunk, summary_type) for chunk in chunks]
         return await asyncio.gather(*tasks)
 
-    def generate_summary(self, text: str, summary_type: str = "brief") -> str:
-        """Generate summary of the input text with specified type."""
+    def validate_summary_type(self, summary_type: str) -> None:
+        """Raise ValueError for unknown summary types."""
         if summary_type not in self.summary_types:
             raise ValueError(
                 f"Invalid summary type. " f"Choose from: " f"{list(self.summary_types.keys())}"
             )  # pylint: disable=line-too-long  # "black" is reformatting these lines
 
-        # Chunk the text
-        chunks = self._chunk_text(text)
-
-        # If single chunk, process synchronously for simplicity
-        if len(chunks) == 1:
-            response = self.model_manager.default_client.invoke(
-                [HumanMessage(content=f"{self.summary_types[summary_type]}:\n\n{chunks[0]}")]
-            )
-            return str(response.content)
-
-        # Process multiple chunks asynchronously
-        summaries = asyncio.run(self._summarize_chunks(chunks, summary_type))
-
-        # Combine results based on summary type
+    def _combine_summaries(self, summaries: list[str], summary_type: str) -> str:
+        """Join chunk summaries according to the summary type."""
         if summary_type == "bullet":
-            combined = "\n".join(summaries)
-        else:
-            combined = " ".join(summaries)
+            return "\n".join(summaries)
+        return " ".join(summaries)
 
-        return combined
+    def generate_summary(self, text: str, summary_type: str = "brief") -> str:
+        """Generate summary of the input text with specified type."""
+        return self.summarize(text, summary_type).summary
+
+    async def agenerate_summary(self, text: str, summary_type: str = "brief") -> str:
+        """Generate summary of the input text from within a running event loop."""
+        return (await self.asummarize(text, summary_type)).summary
+
+    def summarize(self, text: str, summary_type: str = "brief") -> SummaryResult:
+        """Generate a summary and report how much the normalization stage saved.
+
+        Every chunk, including the only chunk of a short text, is subject to
+        `timeout` and is replaced by a "[Partial Result - Timeout ...]" marker
+        when the model does not answer in time; SummaryResult.timed_out_chunks
+        counts these chunks.
+        """
+        self.validate_summary_type(summary_type)
+        # Normalization and chunking are CPU-bound, so they run here rather than on the transport loop
+        chunks, stats = self._prepare_chunks(text)
+        # All chunks go through ainvoke on the shared transport loop, so HTTP connections are reused across calls
+        return transport_loop.run(self._generate(chunks, stats, summary_type))
+
+    async def asummarize(self, text: str, summary_type: str = "brief") -> SummaryResult:
+        """Generate a summary with its normalization savings from within a running event loop."""
+        self.validate_summary_type(summary_type)
+        chunks, stats = self._prepare_chunks(text)
+        return await transport_loop.arun(self._generate(chunks, stats, summary_type))
+
+    async def _generate(self, chunks: list[str], stats: NormalizationStats, summary_type: str) -> SummaryResult:
+        """Summarize the chunks concurrently and combine the results."""
+        results = await asyncio.gather(*(self._invoke_chunk(chunk, summary_type) for chunk in chunks), return_exceptions=True)
+
+        summaries = []
+        timed_out = 0
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, asyncio.TimeoutError):
+                timed_out += 1
+                summaries.append(self._timeout_placeholder(chunk))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                summaries.append(result)
+        return SummaryResult(self._combine_summaries(summaries, summary_type), stats, timed_out)
 
     def set_model(self, model_name: str) -> None:
         """Switch the underlying model."""
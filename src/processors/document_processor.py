@@ -1,14 +1,24 @@
 """
 Module for processing various document formats and extracting text content.
 Supports PDF, TXT, and DOCX files.
+
+The format of a file is detected from its leading bytes rather than trusted
+from its suffix, so mislabeled or extensionless files are routed to the right
+extractor and obviously broken files are rejected before any parser runs.
+
+PDF text is extracted through a pluggable backend (see pdf_backends), falling
+back to pdfplumber for pages where the selected backend yields no usable text.
 """
 
 import os
+import unicodedata
+import zipfile
 
-import pdfplumber
 from docx import Document
 from docx.opc.exceptions import PackageNotFoundError
 
+from src.processors.pdf_backends import PDF_BACKENDS, PdfBackend, PdfplumberBackend
+
 
 class UnsupportedFormatError(Exception):
     """Raised when an unsupported file format is encountered"""
@@ -23,29 +33,50 @@ class DocumentProcessor:
     """Processes document files to extract text from supported formats."""
 
     SUPPORTED_FORMATS = ["pdf", "txt", "docx"]
+    BINARY_FORMATS = ["pdf", "docx"]
+
+    SNIFF_SIZE = 4096  # Bytes read from the head of a file for format detection
+    PDF_TAIL_SIZE = 1024  # Bytes read from the end of a PDF to find the xref trailer
+
+    # Leading byte signatures of formats we recognize but cannot extract text from
+    UNSUPPORTED_SIGNATURES = {
+        b"\xff\xd8\xff": "jpeg",
+        b"\x89PNG\r\n\x1a\n": "png",
+        b"GIF87a": "gif",
+        b"GIF89a": "gif",
+        b"II*\x00": "tiff",
+        b"MM\x00*": "tiff",
+        b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1": "doc",
+        b"\x1f\x8b": "gzip",
+    }
+
+    GARBLED_RATIO = 0.1  # Share of unprintable characters above which page text is considered garbled
 
-    def __init__(self):
+    def __init__(self, pdf_backend="fast"):
         self.base_dir = "src/documents"
+        self._get_pdf_backend(pdf_backend)  # Reject unknown backend names up front
+        self.pdf_backend = pdf_backend
+        self.fallback_backend = PdfplumberBackend()
 
-    def process_file(self, file_path):
+    def process_file(self, file_path, pdf_backend=None):
         """
         Process a document file and extract its text content
         Args:
             file_path (str): Path to the document file
+            pdf_backend (str | None): PDF backend name for this call, defaults to the processor's
         Returns:
             str: Extracted text content
         Raises:
             UnsupportedFormatError: For unsupported file formats
             CorruptedFileError: For corrupted or unreadable files
+            ValueError: For an unknown PDF backend name
         """
-        file_ext = self._get_file_extension(file_path)
-
-        if file_ext not in self.SUPPORTED_FORMATS:
-            raise UnsupportedFormatError(f"Unsupported file format: {file_ext}")  # noqa
+        file_ext = self._detect_format(file_path)
+        backend = self._get_pdf_backend(pdf_backend or self.pdf_backend) if file_ext == "pdf" else None
 
         try:
             if file_ext == "pdf":
-                return self._extract_pdf_text(file_path)
+                return self._extract_pdf_text(file_path, backend)
             if file_ext == "txt":
                 return self._extract_txt_text(file_path)
             if file_ext == "docx":
@@ -61,17 +92,139 @@ class DocumentProcessor:
         _, ext = os.path.splitext(file_path)
         return ext.lower().lstrip(".")
 
-    def _extract_pdf_text(self, file_path):
-        """Extract text from PDF using pdfplumber"""
+    def _detect_format(self, file_path):
+        """
+        Determine which extractor should handle a file, based on its content.
+
+        The sniffed format wins over the file suffix for binary formats, so a
+        PDF saved as ``.txt`` or without an extension is still parsed as a PDF.
+        Text content is only accepted when the suffix is ``txt`` or missing.
+        Args:
+            file_path (str): Path to the document file
+        Returns:
+            str: One of SUPPORTED_FORMATS
+        Raises:
+            UnsupportedFormatError: For unsupported file formats
+            CorruptedFileError: For files failing the structural pre-checks
+        """
+        file_ext = self._get_file_extension(file_path)
+
+        try:
+            sniffed = self._sniff_format(file_path)
+        except OSError as e:
+            raise CorruptedFileError(f"Failed to read file {file_path}: {str(e)}") from e
+
+        if sniffed in self.BINARY_FORMATS:
+            return sniffed
+
+        if sniffed == "txt" and file_ext in ("txt", ""):
+            return "txt"
+
+        if sniffed not in (None, "txt"):
+            raise UnsupportedFormatError(f"Unsupported file format: {sniffed}")
+
+        if sniffed is None and file_ext == "txt":
+            raise CorruptedFileError(f"Text file processing error: {file_path} is not valid UTF-8 text")
+
+        if file_ext in self.BINARY_FORMATS:
+            detected = sniffed or "unknown binary data"
+            raise CorruptedFileError(f"File {file_path} is not a valid {file_ext.upper()} file (detected: {detected})")
+
+        raise UnsupportedFormatError(f"Unsupported file format: {file_ext}")  # noqa
+
+    def _sniff_format(self, file_path):
+        """
+        Detect a file format from its magic bytes and cheap structural checks.
+
+        Returns ``pdf``, ``docx`` or ``txt`` for supported content, the name of
+        a recognized unsupported format (e.g. ``jpeg``), or None for unknown
+        binary data. Raises CorruptedFileError when a PDF or DOCX signature is
+        present but the file structure around it is broken.
+        """
+        with open(file_path, "rb") as f:
+            head = f.read(self.SNIFF_SIZE)
+
+            # The PDF spec allows junk before the header within the first 1024 bytes,
+            # but text merely mentioning "%PDF-" must not be mistaken for a PDF
+            offset = head.find(b"%PDF-", 0, 1024)
+            if offset == 0 or (offset > 0 and not self._is_text(head[:offset])):
+                self._check_pdf_trailer(f, file_path)
+                return "pdf"
+
+        if head.startswith(b"PK\x03\x04"):
+            return self._check_zip_package(file_path)
+
+        for signature, name in self.UNSUPPORTED_SIGNATURES.items():
+            if head.startswith(signature):
+                return name
+
+        return "txt" if self._is_text(head) else None
+
+    def _is_text(self, data):
+        """Tell whether bytes look like UTF-8 text"""
+        if b"\x00" in data:
+            return False
+        try:
+            data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            # A multi-byte character may be cut at the end of the sniffed bytes
+            if e.start < len(data) - 3:
+                return False
+        return True
+
+    def _check_pdf_trailer(self, f, file_path):
+        """Verify that an open PDF ends with a startxref/EOF trailer."""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - self.PDF_TAIL_SIZE))
+        tail = f.read()
+        if b"startxref" not in tail or b"%%EOF" not in tail:
+            raise CorruptedFileError(f"PDF file {file_path} is truncated: missing xref trailer")
+
+    def _check_zip_package(self, file_path):
+        """Read a ZIP central directory and tell DOCX packages apart from other archives."""
         try:
-            pdf_text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    pdf_text += page.extract_text() or ""
-            return pdf_text
+            with zipfile.ZipFile(file_path) as archive:
+                names = set(archive.namelist())
+        except zipfile.BadZipFile as e:
+            raise CorruptedFileError(f"ZIP container of {file_path} is corrupted: {str(e)}") from e
+
+        if "[Content_Types].xml" in names and "word/document.xml" in names:
+            return "docx"
+        return "zip"
+
+    def _get_pdf_backend(self, name):
+        """Instantiate a PDF backend by name"""
+        if name not in PDF_BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {name}. Choose from: {list(PDF_BACKENDS.keys())}")
+        return PDF_BACKENDS[name]()
+
+    def _extract_pdf_text(self, file_path, backend: PdfBackend | None = None):
+        """Extract text from PDF, re-extracting empty or garbled pages with pdfplumber"""
+        backend = backend or self.fallback_backend
+        try:
+            pages = backend.extract_pages(file_path)
+
+            if backend.name != self.fallback_backend.name:
+                retry = [index for index, text in enumerate(pages) if self._needs_fallback(text)]
+                if retry:
+                    for index, text in zip(retry, self.fallback_backend.extract_pages(file_path, retry)):
+                        pages[index] = text
+
+            # Form feeds keep page boundaries visible to the text normalizer
+            return "\f".join(pages)
         except Exception as e:
             raise CorruptedFileError(f"PDF processing error: {str(e)}") from e
 
+    def _needs_fallback(self, text):
+        """Tell whether page text is empty or mostly unprintable characters"""
+        text = "".join(text.split())
+        if not text:
+            return True
+        # Control, unassigned, private-use and surrogate code points, plus U+FFFD
+        garbled = sum(1 for char in text if char == "\ufffd" or unicodedata.category(char).startswith("C"))
+        return garbled / len(text) > self.GARBLED_RATIO
+
     def _extract_txt_text(self, file_path):
         """Extract text from plain text file"""
         try:
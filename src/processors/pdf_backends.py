@@ -0,0 +1,84 @@
+"""
+Module providing interchangeable backends for extracting text from PDF files.
+
+The "fast" backend uses PDFium's text layer directly and skips layout analysis,
+which is all that summarization needs. The "pdfplumber" backend performs full
+layout analysis and is used as a per-page fallback when the fast path returns
+empty or garbled text.
+
+PDFium is not thread-safe, not even across different documents, so every
+PDFium call made by this module is serialized through PDFIUM_LOCK.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+
+import pdfplumber
+import pypdfium2 as pdfium
+
+PDFIUM_LOCK = threading.Lock()
+
+
+class PdfBackend(ABC):
+    """Interface for PDF text extraction backends."""
+
+    name = ""
+
+    @abstractmethod
+    def extract_pages(self, file_path: str, page_numbers: list[int] | None = None) -> list[str]:
+        """
+        Extract the text of a PDF page by page
+        Args:
+            file_path (str): Path to the PDF file
+            page_numbers (list[int] | None): Zero-based pages to extract, all pages if None
+        Returns:
+            list[str]: Text of each requested page, in the requested order
+        """
+
+
+class PdfiumBackend(PdfBackend):
+    """Text-only extraction through PDFium, without layout analysis.
+
+    Safe to call from several threads; documents are extracted one at a time.
+    """
+
+    name = "fast"
+
+    def extract_pages(self, file_path: str, page_numbers: list[int] | None = None) -> list[str]:
+        with PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                if page_numbers is None:
+                    page_numbers = list(range(len(pdf)))
+                return [self._extract_page(pdf, index) for index in page_numbers]
+            finally:
+                pdf.close()
+
+    def _extract_page(self, pdf, index: int) -> str:
+        """Read the text layer of a single page, normalizing PDFium's CRLF line endings"""
+        page = pdf[index]
+        textpage = page.get_textpage()
+        try:
+            text = textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+        return "\n".join(line.rstrip() for line in text.splitlines())
+
+
+class PdfplumberBackend(PdfBackend):
+    """Layout-aware extraction through pdfplumber."""
+
+    name = "pdfplumber"
+
+    def extract_pages(self, file_path: str, page_numbers: list[int] | None = None) -> list[str]:
+        with pdfplumber.open(file_path) as pdf:
+            if page_numbers is None:
+                page_numbers = list(range(len(pdf.pages)))
+            return [pdf.pages[index].extract_text() or "" for index in page_numbers]
+
+
+PDF_BACKENDS: dict[str, type[PdfBackend]] = {
+    PdfiumBackend.name: PdfiumBackend,
+    PdfplumberBackend.name: PdfplumberBackend,
+}
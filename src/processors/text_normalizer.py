@@ -0,0 +1,142 @@
+"""
+Module for compacting extracted document text before it is sent to a model.
+
+Extracted text, PDF text in particular, carries ligatures, hyphenated line
+breaks, page numbers, running headers and runs of whitespace. None of it helps
+a summary, but all of it is billed as prompt tokens. TextNormalizer removes it
+while keeping paragraph breaks intact, since those drive chunking.
+
+Page furniture is only recognized in text carrying page boundaries, i.e. pages
+separated by form feeds ("\f") as produced by DocumentProcessor for PDFs, and
+only in the first and last lines of each page.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+
+# Soft hyphens and zero-width characters that NFKC leaves in place
+INVISIBLE_CHARS = re.compile("[\u00ad\u200b\u200c\u200d\u2060\ufeff]")
+PAGE_BREAK = "\f"
+PAGE_NUMBER_LINE = re.compile(r"^\s*(?:page\s+\d+(?:\s*(?:of|/)\s*\d+)?|[-–—]?\s*\d{1,4}\s*[-–—]?|\d+\s*/\s*\d+)\s*$", re.I)
+HYPHENATED_BREAK = re.compile(r"([^\W\d_]{2,})-\n[ \t]*([^\W\d_]+)")
+HORIZONTAL_SPACE = re.compile(r"[^\S\n]+")
+EXTRA_BLANK_LINES = re.compile(r"\n{3,}")
+DIGITS = re.compile(r"\d+")
+
+
+class NormalizationStats:
+    # pylint: disable=too-few-public-methods
+    """Size of a text before and after normalization."""
+
+    CHARS_PER_TOKEN = 4  # Rough average for English text with the OpenAI/Anthropic tokenizers
+
+    def __init__(self, original_chars: int, normalized_chars: int):
+        self.original_chars = original_chars
+        self.normalized_chars = normalized_chars
+
+    @property
+    def saved_chars(self) -> int:
+        """Number of characters removed."""
+        return self.original_chars - self.normalized_chars
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated number of prompt tokens saved."""
+        return round(self.saved_chars / self.CHARS_PER_TOKEN)
+
+
+class TextNormalizer:
+    """
+    Applies a configurable sequence of text clean-ups:
+    - unicode_normalize: NFKC normalization (ligatures, non-breaking spaces) and removal of invisible characters
+    - page_furniture: drop page numbers and running headers/footers from the edges of "\f"-separated pages
+    - dehyphenate: rejoin words hyphenated across line breaks
+    - whitespace: collapse runs of spaces and blank lines, keeping paragraph breaks
+    """
+
+    def __init__(
+        self,
+        unicode_normalize: bool = True,
+        page_furniture: bool = True,
+        dehyphenate: bool = True,
+        whitespace: bool = True,
+        min_repeats: int = 3,
+        max_furniture_length: int = 80,
+        edge_lines: int = 2,
+    ):
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Initialize the normalizer; every transform can be switched off individually."""
+        self.unicode_normalize = unicode_normalize
+        self.page_furniture = page_furniture
+        self.dehyphenate = dehyphenate
+        self.whitespace = whitespace
+        self.min_repeats = min_repeats  # Pages a short edge line must recur on to count as a running header
+        self.max_furniture_length = max_furniture_length
+        self.edge_lines = edge_lines  # Non-blank lines at the top and bottom of a page that may be furniture
+
+    def normalize(self, text: str) -> tuple[str, NormalizationStats]:
+        """
+        Normalize text
+        Args:
+            text (str): Extracted document text
+        Returns:
+            tuple[str, NormalizationStats]: Normalized text and the savings achieved
+        """
+        original_chars = len(text)
+        if self.unicode_normalize:
+            text = self._normalize_unicode(text)
+        if self.page_furniture and PAGE_BREAK in text:
+            text = self._strip_page_furniture(text)
+        text = text.replace(PAGE_BREAK, "\n")
+        if self.dehyphenate:
+            text = HYPHENATED_BREAK.sub(r"\1\2", text)
+        if self.whitespace:
+            text = self._collapse_whitespace(text)
+        return text, NormalizationStats(original_chars, len(text))
+
+    def _normalize_unicode(self, text: str) -> str:
+        """Fold compatibility characters and drop invisible ones"""
+        return INVISIBLE_CHARS.sub("", unicodedata.normalize("NFKC", text))
+
+    def _strip_page_furniture(self, text: str) -> str:
+        """Remove page numbers and running headers/footers from the edges of each page"""
+        pages = [page.split("\n") for page in text.split(PAGE_BREAK)]
+        edges = [self._edge_indexes(lines) for lines in pages]
+
+        # Headers often embed the page number, so lines are compared with their digits masked
+        pages_per_line: Counter = Counter()
+        for lines, indexes in zip(pages, edges):
+            pages_per_line.update({DIGITS.sub("#", lines[index].strip()) for index in indexes})
+        repeated = {
+            line
+            for line, count in pages_per_line.items()
+            if count >= self.min_repeats and len(line) <= self.max_furniture_length and any(c.isalpha() for c in line)
+        }
+
+        stripped = []
+        for lines, indexes in zip(pages, edges):
+            furniture = {
+                index
+                for index in indexes
+                if PAGE_NUMBER_LINE.match(lines[index]) or DIGITS.sub("#", lines[index].strip()) in repeated
+            }
+            stripped.append("\n".join(line for index, line in enumerate(lines) if index not in furniture))
+
+        if not any(page.strip() for page in stripped):
+            # Everything looked like furniture, so none of it was; never hand an empty text to the model
+            return text
+        return PAGE_BREAK.join(stripped)
+
+    def _edge_indexes(self, lines: list[str]) -> list[int]:
+        """Indexes of the first and last non-blank lines of a page"""
+        if self.edge_lines < 1:
+            return []
+        content = [index for index, line in enumerate(lines) if line.strip()]
+        return sorted(set(content[: self.edge_lines] + content[-self.edge_lines :]))
+
+    def _collapse_whitespace(self, text: str) -> str:
+        """Collapse horizontal whitespace and keep at most one blank line between paragraphs"""
+        text = HORIZONTAL_SPACE.sub(" ", text)
+        text = "\n".join(line.strip() for line in text.split("\n"))
+        return EXTRA_BLANK_LINES.sub("\n\n", text).strip()
@@ -0,0 +1,224 @@
+"""
+Module providing a resumable command-line batch summarizer.
+
+Documents are taken from a directory (walked recursively) or a manifest file
+listing one path per line. Extraction and summarization run concurrently, one
+JSONL record is streamed per document as soon as it finishes, and every
+finished document is appended to a checkpoint file. Re-running with the same
+checkpoint skips those documents, so an interrupted run resumes without sending
+finished documents to the LLM again.
+
+Usage:
+    poetry run python -m src.services.batch_summary src/documents -o summaries.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, TextIO
+
+from src.models.summary import SummaryGenerator
+from src.processors.document_processor import CorruptedFileError, DocumentProcessor, UnsupportedFormatError
+from src.processors.pdf_backends import PDF_BACKENDS
+
+
+def collect_documents(source: str) -> list[str]:
+    """
+    List the documents to process
+    Args:
+        source (str): A directory, or a manifest file with one path per line
+            (blank lines and lines starting with "#" are ignored; relative
+            paths are resolved against the manifest's directory)
+    Returns:
+        list[str]: Absolute document paths, in a stable order
+    """
+    if os.path.isdir(source):
+        paths = []
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            paths.extend(os.path.join(root, name) for name in sorted(files))
+        return [os.path.abspath(path) for path in paths]
+
+    base_dir = os.path.dirname(os.path.abspath(source))
+    with open(source, "r", encoding="utf-8") as f:
+        entries = [line.strip() for line in f]
+    return [os.path.abspath(os.path.join(base_dir, entry)) for entry in entries if entry and not entry.startswith("#")]
+
+
+def load_checkpoint(checkpoint_path: str) -> set[str]:
+    """Read the set of finished document paths from a checkpoint file."""
+    if not os.path.exists(checkpoint_path):
+        return set()
+    done = set()
+    with open(checkpoint_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                done.add(json.loads(line)["path"])
+            except (ValueError, KeyError):
+                # A line cut short by a crash; that document is simply processed again
+                continue
+    return done
+
+
+class BatchSummarizer:
+    """
+    Summarizes many documents concurrently with streaming output and checkpointing.
+
+    Documents that cannot be extracted (unsupported or corrupted files) are
+    recorded as errors and checkpointed, since retrying would fail the same way.
+    Summarization failures, including summaries with timed-out chunks, are
+    recorded but not checkpointed, so they are retried on the next run.
+
+    Extraction runs on a single background thread, because PDF parsers are
+    not safe to use from several threads at once; summarization of
+    extracted documents still proceeds concurrently.
+    """
+
+    def __init__(
+        self,
+        summary_generator: SummaryGenerator,
+        document_processor: DocumentProcessor | None = None,
+        summary_type: str = "brief",
+        concurrency: int = 4,
+    ):
+        """Initialize the batch summarizer."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        summary_generator.validate_summary_type(summary_type)
+        self.summary_generator = summary_generator
+        self.document_processor = document_processor or DocumentProcessor()
+        self.summary_type = summary_type
+        self.concurrency = concurrency
+
+    async def run(self, paths: list[str], output: TextIO, checkpoint_path: str) -> dict[str, int]:
+        """
+        Summarize all documents not yet recorded in the checkpoint
+        Args:
+            paths (list[str]): Documents to process
+            output (TextIO): Stream receiving one JSON record per document
+            checkpoint_path (str): Checkpoint file, created or appended to
+        Returns:
+            dict[str, int]: Counts of "ok", "error" and "skipped" documents
+        """
+        done = load_checkpoint(checkpoint_path)
+        pending = [path for path in paths if path not in done]
+        counts = {"ok": 0, "error": 0, "skipped": len(paths) - len(pending)}
+
+        with open(checkpoint_path, "a+", encoding="utf-8") as checkpoint:
+            if checkpoint.tell() > 0:
+                checkpoint.seek(checkpoint.tell() - 1)
+                if checkpoint.read(1) != "\n":
+                    # Terminate a line cut short by a crash before appending to it
+                    checkpoint.write("\n")
+            # Workers share one iterator, so each document is handed out exactly once
+            documents = iter(pending)
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="extraction") as extractor:
+                workers = [self._worker(documents, output, checkpoint, counts, extractor) for _ in range(self.concurrency)]
+                await asyncio.gather(*workers)
+
+        return counts
+
+    async def _worker(
+        self,
+        documents: Iterator[str],
+        output: TextIO,
+        checkpoint: TextIO,
+        counts: dict[str, int],
+        extractor: ThreadPoolExecutor,
+    ) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Process documents until the shared iterator is exhausted."""
+        for path in documents:
+            record, final = await self._process(path, extractor)
+            counts[record["status"]] += 1
+
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            if final:
+                checkpoint.write(json.dumps({"path": path}) + "\n")
+                checkpoint.flush()
+
+    async def _process(self, path: str, extractor: ThreadPoolExecutor) -> tuple[dict, bool]:
+        """Extract and summarize one document; returns its record and whether it is final."""
+        record: dict = {"path": path, "summary_type": self.summary_type}
+        try:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(extractor, self.document_processor.process_file, path)
+        except (UnsupportedFormatError, CorruptedFileError) as e:
+            record.update(status="error", error=str(e))
+            return record, True
+
+        try:
+            summary = await self.summary_generator.asummarize(text, self.summary_type)
+        except Exception as e:  # pylint: disable=W0718
+            record.update(status="error", error=f"Summarization failed: {str(e)}")
+            return record, False
+
+        if summary.partial:
+            record.update(status="error", error=f"Summarization timed out for {summary.timed_out_chunks} chunk(s)")
+            return record, False
+
+        record.update(
+            status="ok",
+            characters=len(text),
+            characters_saved=summary.normalization.saved_chars,
+            tokens_saved=summary.normalization.saved_tokens,
+            summary=summary.summary,
+        )
+        return record, True
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Summarize a directory or manifest of documents into JSONL.")
+    parser.add_argument("source", help="Directory to walk, or manifest file with one document path per line")
+    parser.add_argument("-o", "--output", help="JSONL output file (appended to); defaults to stdout")
+    parser.add_argument(
+        "-c", "--checkpoint", help="Checkpoint file; defaults to <output>.checkpoint, or batch.checkpoint for stdout"
+    )
+    parser.add_argument("-t", "--summary-type", default="brief", choices=["brief", "detailed", "bullet"])
+    parser.add_argument("-m", "--model", default="openai", choices=["openai", "anthropic"])
+    parser.add_argument("-j", "--concurrency", type=int, default=4, help="Documents processed at the same time")
+    parser.add_argument("--pdf-backend", default="fast", choices=list(PDF_BACKENDS), help="PDF extraction backend")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the batch summarizer from the command line."""
+    args = parse_args(argv)
+    checkpoint_path = args.checkpoint or (f"{args.output}.checkpoint" if args.output else "batch.checkpoint")
+
+    # Imported here so that API keys are only required when actually summarizing
+    from src.models.model_manager import ModelManager  # pylint: disable=import-outside-toplevel
+
+    model_manager = ModelManager()
+    model_manager.switch_client(args.model)
+    summarizer = BatchSummarizer(
+        SummaryGenerator(model_manager),
+        DocumentProcessor(pdf_backend=args.pdf_backend),
+        summary_type=args.summary_type,
+        concurrency=args.concurrency,
+    )
+
+    paths = collect_documents(args.source)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as output:
+            counts = asyncio.run(summarizer.run(paths, output, checkpoint_path))
+    else:
+        counts = asyncio.run(summarizer.run(paths, sys.stdout, checkpoint_path))
+
+    print(
+        f"Summarized {counts['ok']} documents, {counts['error']} errors, {counts['skipped']} skipped (already done).",
+        file=sys.stderr,
+    )
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Module providing an in-process job service for summarization requests.
+
+Jobs are placed on a bounded priority queue and processed by a pool of worker
+tasks that share one SummaryGenerator, and therefore the model clients and the
+rate limiter configured in src.utils.rate_limiting. Interactive jobs are always
+dequeued before batch jobs. When the queue is full, submit() fails immediately
+with QueueFullError instead of blocking the caller.
+"""
+
+import asyncio
+import itertools
+import uuid
+from collections import OrderedDict
+from enum import Enum, IntEnum
+
+from src.models.summary import SummaryGenerator
+from src.processors.text_normalizer import NormalizationStats
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class JobNotFoundError(Exception):
+    """Raised when a job id is not known to the service"""
+
+
+class JobPriority(IntEnum):
+    """Priority classes; lower values are processed first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a summarization job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class SummaryJob:
+    # pylint: disable=too-few-public-methods
+    """A single summarization request and its outcome."""
+
+    def __init__(self, job_id: str, text: str, summary_type: str, priority: JobPriority):
+        self.job_id = job_id
+        self.text = text
+        self.summary_type = summary_type
+        self.priority = priority
+        self.status = JobStatus.QUEUED
+        self.result: str | None = None
+        self.error: str | None = None
+        self.normalization: NormalizationStats | None = None  # Savings of the normalization stage, once completed
+        self.done = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a terminal state."""
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class SummaryJobService:
+    """
+    Runs summarization jobs on a pool of async workers.
+
+    Usage:
+        service = SummaryJobService(summary_generator)
+        await service.start()
+        job_id = service.submit(text, priority=JobPriority.INTERACTIVE)
+        summary = await service.wait(job_id)
+        await service.stop()
+    """
+
+    def __init__(
+        self,
+        summary_generator: SummaryGenerator,
+        max_queue_size: int = 100,
+        num_workers: int = 4,
+        max_finished_jobs: int = 1000,
+    ):
+        """Initialize the service; workers are started by start()."""
+        if max_queue_size < 1 or num_workers < 1 or max_finished_jobs < 1:
+            raise ValueError("max_queue_size, num_workers and max_finished_jobs must be at least 1")
+        self.summary_generator = summary_generator
+        self.max_queue_size = max_queue_size
+        self.num_workers = num_workers
+        self.max_finished_jobs = max_finished_jobs  # Older finished jobs are evicted beyond this count
+        self.jobs: dict[str, SummaryJob] = {}
+        self._finished: OrderedDict[str, None] = OrderedDict()  # Finished job ids, oldest first
+        self._queue: asyncio.PriorityQueue | None = None
+        self._workers: list[asyncio.Task] = []
+        self._running: dict[str, asyncio.Task] = {}
+        self._queued = 0  # Live queued jobs; cancelled entries left in the queue do not count
+        self._sequence = itertools.count()  # Keeps FIFO order within a priority class
+
+    async def start(self) -> None:
+        """Start the worker pool on the running event loop."""
+        if self._workers:
+            return
+        # Capacity is enforced in submit() against live jobs, not against raw queue entries
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.num_workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers, cancelling queued and running jobs."""
+        for job in list(self.jobs.values()):
+            if job.status == JobStatus.QUEUED:
+                self._finish(job, JobStatus.CANCELLED)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._queued = 0
+
+    def submit(self, text: str, summary_type: str = "brief", priority: JobPriority = JobPriority.BATCH) -> str:
+        """
+        Queue a summarization job
+        Args:
+            text (str): Text to summarize
+            summary_type (str): One of SummaryGenerator.summary_types
+            priority (JobPriority): Priority class of the job
+        Returns:
+            str: Id of the queued job
+        Raises:
+            RuntimeError: If the service has not been started
+            ValueError: For an invalid summary type
+            QueueFullError: If the queue is at capacity
+        """
+        if self._queue is None:
+            raise RuntimeError("SummaryJobService is not running; call start() first")
+        self.summary_generator.validate_summary_type(summary_type)
+        if self._queued >= self.max_queue_size:
+            raise QueueFullError(f"Job queue is full ({self.max_queue_size} jobs)")
+
+        job = SummaryJob(uuid.uuid4().hex, text, summary_type, JobPriority(priority))
+        self._queue.put_nowait((job.priority, next(self._sequence), job.job_id))
+        self._queued += 1
+        self.jobs[job.job_id] = job
+        return job.job_id
+
+    def get_job(self, job_id: str) -> SummaryJob:
+        """Return a job by id, raising JobNotFoundError for unknown ids."""
+        try:
+            return self.jobs[job_id]
+        except KeyError as e:
+            raise JobNotFoundError(f"Unknown job id: {job_id}") from e
+
+    def get_status(self, job_id: str) -> JobStatus:
+        """Return the current status of a job."""
+        return self.get_job(job_id).status
+
+    def get_result(self, job_id: str) -> str | None:
+        """Return the summary of a completed job, or None while it is not completed."""
+        return self.get_job(job_id).result
+
+    async def wait(self, job_id: str) -> str | None:
+        """Wait for a job to finish and return its summary (None if it failed or was cancelled)."""
+        job = self.get_job(job_id)
+        await job.done.wait()
+        return job.result
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job
+        Returns:
+            bool: False if the job had already finished
+        """
+        job = self.get_job(job_id)
+        if job.finished:
+            return False
+        if job.job_id in self._running:
+            self._running[job.job_id].cancel()
+        else:
+            # The queue entry stays behind and is skipped by the worker that pops it
+            self._queued -= 1
+            self._finish(job, JobStatus.CANCELLED)
+        return True
+
+    def forget(self, job_id: str) -> None:
+        """Drop a finished job from the registry once its result has been collected."""
+        if self.get_job(job_id).finished:
+            del self.jobs[job_id]
+            self._finished.pop(job_id, None)
+
+    def _finish(self, job: SummaryJob, status: JobStatus, result: str | None = None, error: str | None = None) -> None:
+        """Move a job to a terminal state and wake up its waiters."""
+        job.status = status
+        job.result = result
+        job.error = error
+        job.done.set()
+
+        # The document text is no longer needed, and the registry only keeps the most recent finished jobs
+        job.text = ""
+        self._finished[job.job_id] = None
+        while len(self._finished) > self.max_finished_jobs:
+            evicted, _ = self._finished.popitem(last=False)
+            self.jobs.pop(evicted, None)
+
+    async def _worker(self) -> None:
+        """Pull jobs off the queue and summarize them until cancelled."""
+        assert self._queue is not None
+        while True:
+            _, _, job_id = await self._queue.get()
+            try:
+                job = self.jobs.get(job_id)
+                if job is None or job.status != JobStatus.QUEUED:
+                    continue
+                self._queued -= 1
+                await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: SummaryJob) -> None:
+        """Summarize a single job, recording its outcome."""
+        job.status = JobStatus.RUNNING
+        task = asyncio.create_task(self.summary_generator.asummarize(job.text, job.summary_type))
+        self._running[job.job_id] = task
+        try:
+            summary = await task
+        except asyncio.CancelledError:
+            self._finish(job, JobStatus.CANCELLED)
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                # The worker itself is being stopped; cancel() only cancels the inner task
+                task.cancel()
+                raise
+        except Exception as e:  # pylint: disable=W0718
+            self._finish(job, JobStatus.FAILED, error=str(e))
+        else:
+            job.normalization = summary.normalization
+            self._finish(job, JobStatus.COMPLETED, result=summary.summary)
+        finally:
+            self._running.pop(job.job_id, None)
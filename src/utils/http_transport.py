@@ -0,0 +1,101 @@
+"""
+Module providing the shared HTTP transport used by all model providers.
+
+Every provider client is built on the same long-lived httpx connection pools,
+so keep-alive connections and TLS sessions are reused across calls instead of
+being rebuilt per request. Pool limits are tunable through the environment:
+
+    HTTP_MAX_CONNECTIONS            Maximum open connections (default 100)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS  Idle connections kept open (default 20)
+    HTTP_KEEPALIVE_EXPIRY           Seconds an idle connection is kept (default 30)
+    HTTP_HTTP2                      Negotiate HTTP/2 when the "h2" package is installed (default true)
+
+An httpx.AsyncClient is bound to the event loop that first uses it, so all
+async model calls are run on one long-lived loop owned by this module
+(transport_loop) rather than on a fresh asyncio.run() loop per call.
+"""
+
+import asyncio
+import importlib.util
+import os
+import threading
+from typing import Any, Coroutine, TypeVar
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+T = TypeVar("T")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+pool_limits = httpx.Limits(
+    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+)
+use_http2 = HTTP2_AVAILABLE and _env_flag("HTTP_HTTP2", True)
+default_timeout = httpx.Timeout(60.0, connect=10.0)  # Provider SDKs override this per request
+
+
+def create_http_client(**kwargs: Any) -> httpx.Client:
+    """Create a blocking client with the configured pool settings."""
+    return httpx.Client(limits=pool_limits, http2=use_http2, timeout=default_timeout, **kwargs)
+
+
+def create_async_http_client(**kwargs: Any) -> httpx.AsyncClient:
+    """Create an async client with the configured pool settings."""
+    return httpx.AsyncClient(limits=pool_limits, http2=use_http2, timeout=default_timeout, **kwargs)
+
+
+class TransportLoop:
+    """A long-lived event loop running on a daemon thread."""
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the loop, starting its thread on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="http-transport", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the transport loop and block until it finishes."""
+        loop = self.loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError("TransportLoop.run() cannot be called from the transport loop; use arun()")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def arun(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the transport loop from any event loop."""
+        loop = self.loop
+        if asyncio.get_running_loop() is loop:
+            return await coro
+        # Cancelling the awaiting task also cancels the coroutine on the transport loop
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+http_client = create_http_client()
+http_async_client = create_async_http_client()
+transport_loop = TransportLoop()
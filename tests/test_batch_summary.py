@@ -0,0 +1,164 @@
+import asyncio
+import io
+import json
+import shutil
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.models.model_manager import ModelManager
+from src.models.summary import SummaryGenerator
+from src.processors.document_processor import DocumentProcessor
+from src.services.batch_summary import BatchSummarizer, collect_documents, load_checkpoint, parse_args
+
+
+@pytest.fixture
+def mock_model_manager():
+    mock_mgr = Mock(spec=ModelManager)
+    mock_mgr.default_client = Mock()
+    mock_mgr.default_client.ainvoke = AsyncMock(return_value=Mock(content="Mocked summary"))
+    return mock_mgr
+
+
+@pytest.fixture
+def documents(tmp_path):
+    docs = tmp_path / "docs"
+    (docs / "nested").mkdir(parents=True)
+    (docs / "a.txt").write_text("First document.", encoding="utf-8")
+    (docs / "b.txt").write_text("Second document.", encoding="utf-8")
+    (docs / "nested" / "c.txt").write_text("Third document.", encoding="utf-8")
+    return docs
+
+
+def read_records(output):
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_collect_documents_from_directory(documents):
+    paths = collect_documents(str(documents))
+    assert [path.rsplit("docs", 1)[-1] for path in paths] == ["/a.txt", "/b.txt", "/nested/c.txt"]
+
+
+def test_collect_documents_from_manifest(documents):
+    manifest = documents / "manifest.txt"
+    manifest.write_text("# documents to summarize\na.txt\n\nnested/c.txt\n", encoding="utf-8")
+    assert collect_documents(str(manifest)) == [str(documents / "a.txt"), str(documents / "nested" / "c.txt")]
+
+
+async def test_run_streams_one_record_per_document(documents, mock_model_manager, tmp_path):
+    (documents / "photo.jpg").write_bytes(b"\xff\xd8\xff\xe0" + b"\x00" * 16)
+    summarizer = BatchSummarizer(SummaryGenerator(mock_model_manager), concurrency=2)
+    output = io.StringIO()
+
+    counts = await summarizer.run(collect_documents(str(documents)), output, str(tmp_path / "run.checkpoint"))
+
+    records = read_records(output)
+    assert counts == {"ok": 3, "error": 1, "skipped": 0}
+    assert len(records) == 4
+    assert {record["status"] for record in records if record["path"].endswith(".txt")} == {"ok"}
+    assert all(record["summary"] == "Mocked summary" for record in records if record["status"] == "ok")
+    assert all(record["characters_saved"] == 0 for record in records if record["status"] == "ok")
+    assert "Unsupported" in next(record["error"] for record in records if record["status"] == "error")
+
+
+async def test_resume_skips_finished_documents(documents, mock_model_manager, tmp_path):
+    checkpoint = str(tmp_path / "run.checkpoint")
+    paths = collect_documents(str(documents))
+    client = mock_model_manager.default_client
+
+    # First run is interrupted after the first document
+    await BatchSummarizer(SummaryGenerator(mock_model_manager)).run(paths[:1], io.StringIO(), checkpoint)
+    assert client.ainvoke.call_count == 1
+    assert load_checkpoint(checkpoint) == {paths[0]}
+
+    client.ainvoke.reset_mock()
+    output = io.StringIO()
+    counts = await BatchSummarizer(SummaryGenerator(mock_model_manager)).run(paths, output, checkpoint)
+
+    assert counts == {"ok": 2, "error": 0, "skipped": 1}
+    assert client.ainvoke.call_count == 2
+    assert paths[0] not in [record["path"] for record in read_records(output)]
+    sent = " ".join(call.args[0][0].content for call in client.ainvoke.call_args_list)
+    assert "First document." not in sent
+
+
+async def test_failed_summaries_are_retried(documents, mock_model_manager, tmp_path):
+    checkpoint = str(tmp_path / "run.checkpoint")
+    paths = collect_documents(str(documents))
+    mock_model_manager.default_client.ainvoke = AsyncMock(side_effect=Exception("Simulated API error"))
+
+    counts = await BatchSummarizer(SummaryGenerator(mock_model_manager)).run(paths, io.StringIO(), checkpoint)
+    assert counts["error"] == 3
+    assert load_checkpoint(checkpoint) == set()
+
+    mock_model_manager.default_client.ainvoke = AsyncMock(return_value=Mock(content="Mocked summary"))
+    counts = await BatchSummarizer(SummaryGenerator(mock_model_manager)).run(paths, io.StringIO(), checkpoint)
+    assert counts == {"ok": 3, "error": 0, "skipped": 0}
+
+
+def test_truncated_checkpoint_line_is_ignored(tmp_path):
+    checkpoint = tmp_path / "run.checkpoint"
+    checkpoint.write_text('{"path": "/docs/a.txt"}\n{"path": "/docs/b', encoding="utf-8")
+    assert load_checkpoint(str(checkpoint)) == {"/docs/a.txt"}
+
+
+async def test_resume_after_truncated_checkpoint(documents, mock_model_manager, tmp_path):
+    checkpoint = tmp_path / "run.checkpoint"
+    paths = collect_documents(str(documents))
+    checkpoint.write_text(json.dumps({"path": paths[0]}) + '\n{"path": "/docs/b', encoding="utf-8")
+
+    await BatchSummarizer(SummaryGenerator(mock_model_manager)).run(paths, io.StringIO(), str(checkpoint))
+    assert load_checkpoint(str(checkpoint)) == set(paths)
+
+
+async def test_concurrent_run_extracts_pdfs_one_at_a_time(mock_model_manager, tmp_path, monkeypatch):
+    docs = tmp_path / "pdfs"
+    docs.mkdir()
+    for i in range(12):
+        shutil.copy("src/documents/sample-pdf-file.pdf", docs / f"sample-{i}.pdf")
+
+    processor = DocumentProcessor()
+    process_file = processor.process_file
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def tracking_process_file(path):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            return process_file(path)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    monkeypatch.setattr(processor, "process_file", tracking_process_file)
+    summarizer = BatchSummarizer(SummaryGenerator(mock_model_manager), processor, concurrency=4)
+    counts = await summarizer.run(collect_documents(str(docs)), io.StringIO(), str(tmp_path / "run.checkpoint"))
+
+    assert counts == {"ok": 12, "error": 0, "skipped": 0}
+    assert peak[0] == 1
+
+
+async def test_timed_out_summaries_are_retried(documents, mock_model_manager, tmp_path):
+    checkpoint = str(tmp_path / "run.checkpoint")
+    paths = collect_documents(str(documents))
+
+    async def slow(_messages):
+        await asyncio.sleep(1)
+
+    mock_model_manager.default_client.ainvoke = AsyncMock(side_effect=slow)
+    output = io.StringIO()
+    counts = await BatchSummarizer(SummaryGenerator(mock_model_manager, timeout=0.05)).run(paths, output, checkpoint)
+
+    assert counts == {"ok": 0, "error": 3, "skipped": 0}
+    assert all("timed out" in record["error"] for record in read_records(output))
+    assert load_checkpoint(checkpoint) == set()
+
+
+def test_unknown_pdf_backend_is_rejected():
+    with pytest.raises(SystemExit):
+        parse_args(["src/documents", "--pdf-backend", "fsat"])
+    with pytest.raises(ValueError, match="Unknown PDF backend"):
+        DocumentProcessor(pdf_backend="fsat")
@@ -1,14 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from docx import Document as DocxDocument
 
 from src.processors.document_processor import CorruptedFileError, DocumentProcessor, UnsupportedFormatError
+from src.processors.pdf_backends import PdfBackend, PdfiumBackend, PdfplumberBackend
 
-
-# 1. Test successful PDF processing
-def test_process_pdf_success(tmp_path):
-    # Create a temporary PDF file with a minimal valid structure that includes "Hello, PDF!"
-    pdf_file = tmp_path / "test.pdf"
-    pdf_content = b"""%PDF-1.1
+MINIMAL_PDF = b"""%PDF-1.1
 1 0 obj
 << /Type /Catalog /Pages 2 0 R >>
 endobj
@@ -41,7 +39,13 @@ startxref
 260
 %%EOF
 """
-    pdf_file.write_bytes(pdf_content)
+
+
+# 1. Test successful PDF processing
+def test_process_pdf_success(tmp_path):
+    # Create a temporary PDF file with a minimal valid structure that includes "Hello, PDF!"
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(MINIMAL_PDF)
     processor = DocumentProcessor()
     text = processor.process_file(str(pdf_file))
     # Check that the extracted text contains the expected string.
@@ -104,3 +108,145 @@ def test_empty_txt_file(tmp_path):
     text = processor.process_file(str(empty_txt))
     # For TXT files, reading an empty file should return an empty string
     assert text == ""
+
+
+# 7. Test that a PDF without a .pdf extension is routed to the PDF extractor
+def test_mislabeled_pdf_is_detected(tmp_path):
+    mislabeled = tmp_path / "report"
+    mislabeled.write_bytes(MINIMAL_PDF)
+
+    processor = DocumentProcessor()
+    assert processor._sniff_format(str(mislabeled)) == "pdf"
+    assert "Hello, PDF!" in processor.process_file(str(mislabeled))
+
+
+# 8. Test that a DOCX saved with a .txt extension is routed to the DOCX extractor
+def test_mislabeled_docx_is_detected(tmp_path):
+    docx_file = tmp_path / "notes.txt"
+    doc = DocxDocument()
+    doc.add_paragraph("Hello, DOCX!")
+    doc.save(str(docx_file))
+
+    processor = DocumentProcessor()
+    assert "Hello, DOCX!" in processor.process_file(str(docx_file))
+
+
+# 9. Test that a renamed JPEG is rejected before any parser runs
+def test_renamed_jpeg_is_rejected(tmp_path, monkeypatch):
+    fake_pdf = tmp_path / "photo.pdf"
+    fake_pdf.write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + b"\x00" * 64)
+
+    processor = DocumentProcessor()
+    monkeypatch.setattr(processor, "_extract_pdf_text", lambda *_: pytest.fail("PDF parser should not run"))
+    with pytest.raises(UnsupportedFormatError, match="jpeg"):
+        processor.process_file(str(fake_pdf))
+
+
+# 10. Test that a PDF missing its xref trailer fails the structural pre-check
+def test_truncated_pdf_is_rejected(tmp_path):
+    truncated = tmp_path / "truncated.pdf"
+    truncated.write_bytes(b"%PDF-1.4\n1 0 obj\n<< /Type /Catalog >>\nendobj\n")
+
+    processor = DocumentProcessor()
+    with pytest.raises(CorruptedFileError, match="xref"):
+        processor.process_file(str(truncated))
+
+
+# 11. Test that a file with a ZIP signature but a broken central directory is rejected
+def test_broken_zip_is_rejected(tmp_path):
+    broken = tmp_path / "broken.docx"
+    broken.write_bytes(b"PK\x03\x04" + b"\x00" * 128)
+
+    processor = DocumentProcessor()
+    with pytest.raises(CorruptedFileError):
+        processor.process_file(str(broken))
+
+
+# 12. Test that extensionless plain text is treated as TXT
+def test_extensionless_text_file(tmp_path):
+    readme = tmp_path / "README"
+    readme.write_text("Hello, plain text!", encoding="utf-8")
+
+    processor = DocumentProcessor()
+    assert processor.process_file(str(readme)) == "Hello, plain text!"
+
+
+# 13. Test that every PDF backend extracts the same text
+@pytest.mark.parametrize("backend", ["fast", "pdfplumber"])
+def test_pdf_backends(tmp_path, backend):
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(MINIMAL_PDF)
+
+    processor = DocumentProcessor()
+    assert "Hello, PDF!" in processor.process_file(str(pdf_file), pdf_backend=backend)
+
+
+# 14. Test that the fast backend falls back to pdfplumber only for empty or garbled pages
+def test_pdf_fast_backend_fallback(tmp_path, monkeypatch):
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(MINIMAL_PDF)
+    requested = []
+
+    def fake_fast_pages(self, file_path, page_numbers=None):
+        return ["Readable page", "", "\x00\x01�� garbled"]
+
+    def fake_fallback_pages(self, file_path, page_numbers=None):
+        requested.extend(page_numbers)
+        return [f"Recovered {index}" for index in page_numbers]
+
+    monkeypatch.setattr(PdfiumBackend, "extract_pages", fake_fast_pages)
+    monkeypatch.setattr(PdfplumberBackend, "extract_pages", fake_fallback_pages)
+
+    processor = DocumentProcessor(pdf_backend="fast")
+    text = processor.process_file(str(pdf_file))
+    assert requested == [1, 2]
+    assert text == "Readable page\fRecovered 1\fRecovered 2"
+
+
+# 15. Test that an unknown PDF backend name is reported as such
+def test_unknown_pdf_backend(tmp_path):
+    pdf_file = tmp_path / "test.pdf"
+    pdf_file.write_bytes(MINIMAL_PDF)
+
+    processor = DocumentProcessor()
+    with pytest.raises(ValueError, match="Unknown PDF backend"):
+        processor.process_file(str(pdf_file), pdf_backend="missing")
+
+
+# 16. Test that a .txt file which is not valid UTF-8 is reported as corrupted
+@pytest.mark.parametrize("encoding", ["latin-1", "utf-16"])
+def test_non_utf8_txt_file(tmp_path, encoding):
+    txt_file = tmp_path / "legacy.txt"
+    txt_file.write_bytes("Café crème, déjà vu".encode(encoding))
+
+    processor = DocumentProcessor()
+    with pytest.raises(CorruptedFileError, match="UTF-8"):
+        processor.process_file(str(txt_file))
+
+
+# 17. Test that a text file mentioning the PDF header is still treated as text
+def test_txt_file_mentioning_pdf_header(tmp_path):
+    txt_file = tmp_path / "notes.txt"
+    txt_file.write_text("Every PDF starts with %PDF-1.x followed by objects.", encoding="utf-8")
+
+    processor = DocumentProcessor()
+    assert processor.process_file(str(txt_file)) == "Every PDF starts with %PDF-1.x followed by objects."
+
+
+# 18. Test that a backend without extract_pages fails at creation time
+def test_incomplete_pdf_backend():
+    class IncompleteBackend(PdfBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+# 19. Test that the fast PDF backend can be used from several threads at once
+def test_pdf_fast_backend_concurrent_threads():
+    path = "src/documents/sample-pdf-file.pdf"
+    backend = PdfiumBackend()
+    expected = backend.extract_pages(path)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: backend.extract_pages(path), range(64)))
+    assert all(result == expected for result in results)
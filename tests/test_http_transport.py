@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+from langchain.chat_models import init_chat_model
+
+import src.models.anthropic_config as anthropic_config
+import src.models.cohere_config as cohere_config
+import src.models.openai_config as openai_config
+from src.models.model_manager import ModelManager
+from src.models.summary import SummaryGenerator
+from src.utils.http_transport import http_async_client, http_client, transport_loop
+
+COMPLETION = {
+    "id": "chatcmpl-stub",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "Stub summary"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections open between requests
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.client_ports.append(self.client_address[1])
+        body = json.dumps(COMPLETION).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.client_ports = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stub_generator(stub_server):
+    model = init_chat_model(
+        "gpt-4o",
+        model_provider="openai",
+        openai_api_key="dummy",
+        base_url=f"http://127.0.0.1:{stub_server.server_address[1]}/v1",
+        http_client=http_client,
+        http_async_client=http_async_client,
+        max_retries=0,
+    )
+    model_manager = Mock(spec=ModelManager)
+    model_manager.default_client = model
+    return SummaryGenerator(model_manager, chunk_size=50)
+
+
+def test_providers_share_connection_pools():
+    assert openai_config.openai_model.root_client._client is http_client
+    assert openai_config.openai_model.root_async_client._client is http_async_client
+    assert anthropic_config.anthropic_model._client._client is http_client
+    assert anthropic_config.anthropic_model._async_client._client is http_async_client
+    assert cohere_config.cohere_model.client._client_wrapper.httpx_client.httpx_client is http_client
+    assert cohere_config.cohere_model.async_client._client_wrapper.httpx_client.httpx_client is http_async_client
+
+
+def test_connection_reused_across_calls(stub_server, stub_generator):
+    assert stub_generator.generate_summary("Short text.") == "Stub summary"
+    # Multi-chunk input sends its chunks concurrently
+    stub_generator.generate_summary("\n\n".join(f"Paragraph number {i} is here." for i in range(4)))
+    assert stub_generator.generate_summary("Another short text.") == "Stub summary"
+
+    # Concurrent chunks may open extra connections, but later calls reuse pooled ones
+    assert len(stub_server.client_ports) == 6
+    assert stub_server.client_ports[-1] in stub_server.client_ports[:-1]
+    assert stub_server.client_ports[0] in stub_server.client_ports[1:5]
+
+
+def test_connection_reused_across_event_loops(stub_server, stub_generator):
+    for _ in range(2):
+        assert asyncio.run(stub_generator.agenerate_summary("Short text.")) == "Stub summary"
+    assert stub_generator.generate_summary("Short text.") == "Stub summary"
+    assert len(set(stub_server.client_ports)) == 1
+
+
+def test_run_rejects_calls_from_transport_loop():
+    async def nested():
+        coro = asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            transport_loop.run(coro)
+
+    transport_loop.run(nested())
+
+
+def test_anthropic_clients_keep_original_settings():
+    model = anthropic_config.anthropic_model
+    params = model._client_params
+    assert model._async_client.timeout == params["timeout"]
+    assert str(model._async_client.base_url).rstrip("/") == params["base_url"].rstrip("/")
+    assert model._async_client.max_retries == params["max_retries"]
+
+
+def test_text_is_prepared_off_the_transport_loop(stub_generator, monkeypatch):
+    threads = []
+    normalize = stub_generator.normalizer.normalize
+
+    def recording_normalize(text):
+        threads.append(threading.current_thread().name)
+        return normalize(text)
+
+    monkeypatch.setattr(stub_generator.normalizer, "normalize", recording_normalize)
+    stub_generator.generate_summary("Short text.")
+    asyncio.run(stub_generator.agenerate_summary("Short text."))
+    assert threads and "http-transport" not in threads
@@ -30,7 +30,7 @@ def test_summary_generation(summary_generator):
     result = summary_generator.generate_summary(text, "brief")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert summary_generator.model_manager.default_client.invoke.called
+    assert summary_generator.model_manager.default_client.ainvoke.called
 
 
 def test_detailed_summary_generation(summary_generator):
@@ -38,7 +38,7 @@ def test_detailed_summary_generation(summary_generator):
     result = summary_generator.generate_summary(text, "detailed")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert "detailed" in summary_generator.model_manager.default_client.invoke.call_args[0][0][0].content.lower()  # noqa
+    assert "detailed" in summary_generator.model_manager.default_client.ainvoke.call_args[0][0][0].content.lower()  # noqa
 
 
 def test_bullet_point_summary_generation(summary_generator):
@@ -46,14 +46,14 @@ def test_bullet_point_summary_generation(summary_generator):
     result = summary_generator.generate_summary(text, "bullet")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert "bullet" in summary_generator.model_manager.default_client.invoke.call_args[0][0][0].content.lower()  # noqa
+    assert "bullet" in summary_generator.model_manager.default_client.ainvoke.call_args[0][0][0].content.lower()  # noqa
 
 
 @pytest.mark.asyncio
 async def test_handling_very_long_input(summary_generator):
     long_text = "This is a very long text " * 1000
     assert len(long_text) > summary_generator.chunk_size
-    # Directly await the async path since generate_summary uses asyncio.run()
+    # Directly await the async path; generate_summary blocks until the transport loop finishes
     chunks = summary_generator._chunk_text(long_text)
     result = " ".join(await summary_generator._summarize_chunks(chunks, "brief"))
     assert isinstance(result, str)
@@ -66,16 +66,16 @@ def test_handling_very_short_input(summary_generator):
     result = summary_generator.generate_summary(short_text, "brief")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert summary_generator.model_manager.default_client.invoke.called
+    assert summary_generator.model_manager.default_client.ainvoke.called
 
 
 def test_handling_special_characters(summary_generator):
-    special_text = "Text with !@#$%^&*() chars"  # Keep under 50 chars for sync path
+    special_text = "Text with !@#$%^&*() chars"  # Keep under 50 chars for a single chunk
     assert len(special_text) <= summary_generator.chunk_size
     result = summary_generator.generate_summary(special_text, "brief")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert summary_generator.model_manager.default_client.invoke.called
+    assert summary_generator.model_manager.default_client.ainvoke.called
 
 
 def test_handling_multiple_languages(summary_generator):
@@ -83,7 +83,7 @@ def test_handling_multiple_languages(summary_generator):
     result = summary_generator.generate_summary(multi_lang_text, "brief")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert summary_generator.model_manager.default_client.invoke.called
+    assert summary_generator.model_manager.default_client.ainvoke.called
 
 
 def test_handling_technical_content(summary_generator):
@@ -91,7 +91,7 @@ def test_handling_technical_content(summary_generator):
     result = summary_generator.generate_summary(tech_text, "detailed")
     assert isinstance(result, str)
     assert len(result) > 0
-    assert summary_generator.model_manager.default_client.invoke.called
+    assert summary_generator.model_manager.default_client.ainvoke.called
 
 
 def test_invalid_summary_type(summary_generator):
@@ -0,0 +1,159 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.models.model_manager import ModelManager
+from src.models.summary import SummaryGenerator
+from src.services.summary_jobs import JobNotFoundError, JobPriority, JobStatus, QueueFullError, SummaryJobService
+
+
+@pytest.fixture
+def mock_model_manager():
+    mock_mgr = Mock(spec=ModelManager)
+    mock_mgr.default_client = Mock()
+    mock_mgr.default_client.ainvoke = AsyncMock(return_value=Mock(content="Mocked summary"))
+    return mock_mgr
+
+
+@pytest.fixture
+async def job_service(mock_model_manager):
+    service = SummaryJobService(SummaryGenerator(mock_model_manager, timeout=5), max_queue_size=3, num_workers=1)
+    await service.start()
+    yield service
+    await service.stop()
+
+
+async def test_job_completes(job_service):
+    job_id = job_service.submit("Some text to summarize", "brief")
+    assert await job_service.wait(job_id) == "Mocked summary"
+    assert job_service.get_status(job_id) == JobStatus.COMPLETED
+    assert job_service.get_result(job_id) == "Mocked summary"
+
+
+async def test_submit_before_start(mock_model_manager):
+    service = SummaryJobService(SummaryGenerator(mock_model_manager))
+    with pytest.raises(RuntimeError):
+        service.submit("text")
+
+
+async def test_invalid_summary_type_is_rejected(job_service):
+    with pytest.raises(ValueError, match="Invalid summary type"):
+        job_service.submit("text", "invalid_type")
+
+
+async def test_interactive_jobs_skip_ahead(job_service, mock_model_manager):
+    order = []
+
+    async def record(messages):
+        order.append(messages[0].content.rsplit("\n", 1)[-1])
+        return Mock(content="ok")
+
+    mock_model_manager.default_client.ainvoke = AsyncMock(side_effect=record)
+    # Queue everything before the single worker gets a chance to run
+    batch_1 = job_service.submit("batch 1")
+    batch_2 = job_service.submit("batch 2")
+    interactive = job_service.submit("interactive", priority=JobPriority.INTERACTIVE)
+    for job_id in (batch_1, batch_2, interactive):
+        await job_service.wait(job_id)
+    assert order == ["interactive", "batch 1", "batch 2"]
+
+
+async def test_full_queue_rejects_immediately(job_service):
+    for _ in range(3):
+        job_service.submit("text")
+    with pytest.raises(QueueFullError):
+        job_service.submit("text")
+
+
+async def test_cancelled_jobs_free_queue_capacity(job_service):
+    for _ in range(3):
+        job_service.cancel(job_service.submit("text"))
+    job_ids = [job_service.submit("text") for _ in range(3)]
+    for job_id in job_ids:
+        assert await job_service.wait(job_id) == "Mocked summary"
+
+
+async def test_cancel_queued_job(job_service):
+    job_id = job_service.submit("text")
+    assert job_service.cancel(job_id) is True
+    assert await job_service.wait(job_id) is None
+    assert job_service.get_status(job_id) == JobStatus.CANCELLED
+    assert job_service.cancel(job_id) is False
+
+
+async def test_cancel_running_job(job_service, mock_model_manager):
+    started = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def hang(_messages):
+        # Model calls run on the transport loop's thread
+        loop.call_soon_threadsafe(started.set)
+        await asyncio.sleep(60)
+
+    mock_model_manager.default_client.ainvoke = AsyncMock(side_effect=hang)
+    job_id = job_service.submit("text")
+    await started.wait()
+    assert job_service.get_status(job_id) == JobStatus.RUNNING
+    job_service.cancel(job_id)
+    await job_service.wait(job_id)
+    assert job_service.get_status(job_id) == JobStatus.CANCELLED
+
+    # The worker keeps serving jobs after a cancellation
+    mock_model_manager.default_client.ainvoke = AsyncMock(return_value=Mock(content="Mocked summary"))
+    assert await job_service.wait(job_service.submit("text")) == "Mocked summary"
+
+
+async def test_failed_job_records_error(job_service, mock_model_manager):
+    mock_model_manager.default_client.ainvoke = AsyncMock(side_effect=Exception("Simulated API error"))
+    job_id = job_service.submit("text")
+    assert await job_service.wait(job_id) is None
+    job = job_service.get_job(job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "Simulated API error"
+
+
+async def test_unknown_job_id(job_service):
+    with pytest.raises(JobNotFoundError):
+        job_service.get_status("missing")
+
+
+async def test_stop_with_running_job(mock_model_manager):
+    started = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def hang(_messages):
+        # Model calls run on the transport loop's thread
+        loop.call_soon_threadsafe(started.set)
+        await asyncio.sleep(60)
+
+    mock_model_manager.default_client.ainvoke = AsyncMock(side_effect=hang)
+    service = SummaryJobService(SummaryGenerator(mock_model_manager, timeout=30), num_workers=1)
+    await service.start()
+    running = service.submit("running")
+    queued = service.submit("queued")
+    await started.wait()
+
+    await asyncio.wait_for(service.stop(), timeout=3)
+    assert service.get_status(running) == JobStatus.CANCELLED
+    assert service.get_status(queued) == JobStatus.CANCELLED
+
+
+async def test_finished_jobs_release_text_and_are_evicted(mock_model_manager):
+    service = SummaryJobService(SummaryGenerator(mock_model_manager), num_workers=1, max_finished_jobs=2)
+    await service.start()
+    job_ids = [service.submit(f"Document {i}") for i in range(3)]
+    for job_id in job_ids:
+        await service.wait(job_id)
+
+    assert job_ids[0] not in service.jobs
+    for job_id in job_ids[1:]:
+        assert service.get_job(job_id).text == ""
+        assert service.get_result(job_id) == "Mocked summary"
+    await service.stop()
+
+
+async def test_completed_job_reports_normalization_savings(job_service):
+    job_id = job_service.submit("Some    text   with   extra   spaces")
+    await job_service.wait(job_id)
+    assert job_service.get_job(job_id).normalization.saved_chars > 0
@@ -0,0 +1,81 @@
+from unittest.mock import AsyncMock, Mock
+
+from src.models.model_manager import ModelManager
+from src.models.summary import SummaryGenerator
+from src.processors.text_normalizer import TextNormalizer
+
+
+def only(**enabled):
+    transforms = {"unicode_normalize": False, "page_furniture": False, "dehyphenate": False, "whitespace": False}
+    transforms.update(enabled)
+    return TextNormalizer(**transforms)
+
+
+def test_unicode_normalization():
+    text, _ = only(unicode_normalize=True).normalize("e\ufb03cient \ufb01le,\u00a0soft\u00adhyphen\u200b")
+    assert text == "efficient file, softhyphen"
+
+
+def test_page_number_lines_are_stripped():
+    pages = ["Page 1 of 3\nFirst page.", "12\nSecond page with 12 items.\n- 4 -", "Third page.\n2/7"]
+    text, _ = only(page_furniture=True).normalize("\f".join(pages))
+    assert text == "First page.\nSecond page with 12 items.\nThird page."
+
+
+def test_repeated_headers_are_stripped():
+    page = "ACME Corp Annual Report - page {0}\nIntro.\nBody text {0}.\nMore body text.\nOutro.\nConfidential"
+    text, _ = only(page_furniture=True).normalize("\f".join(page.format(i) for i in range(3)))
+    assert "ACME Corp" not in text
+    assert "Confidential" not in text
+    assert text.count("Body text") == 3
+    assert text.count("More body text.") == 3
+
+
+def test_headers_below_repeat_threshold_are_kept():
+    text, _ = only(page_furniture=True).normalize("Introduction\nText.\fIntroduction\nMore text.")
+    assert text.count("Introduction") == 2
+
+
+def test_text_without_page_breaks_keeps_numbers_and_repeats():
+    table = "Year\n2023\n2024\nUnits\n150\nShipped\nYes\nYes\nYes\n"
+    chorus = "Oh what a night\nverse one\nOh what a night\nverse two\nOh what a night\n"
+    text, _ = only(page_furniture=True).normalize(table + chorus)
+    assert text == table + chorus
+
+
+def test_furniture_stripping_never_empties_text():
+    text, _ = only(page_furniture=True).normalize("\f".join(["Same line here."] * 4))
+    assert text.count("Same line here.") == 4
+
+
+def test_dehyphenation():
+    text, _ = only(dehyphenate=True).normalize("The docu-\nment was summa-\n  rized. Well-\n1990 stays.")
+    assert text == "The document was summarized. Well-\n1990 stays."
+
+
+def test_whitespace_collapse_keeps_paragraphs():
+    text, _ = only(whitespace=True).normalize("  First \t  paragraph  \nline two.\n\n\n\n\nSecond   paragraph.  ")
+    assert text == "First paragraph\nline two.\n\nSecond paragraph."
+
+
+def test_stats_report_savings():
+    original = "Hello    world\n\n\n\n\n\n\n\nagain    "
+    text, stats = TextNormalizer().normalize(original)
+    assert stats.original_chars == len(original)
+    assert stats.normalized_chars == len(text)
+    assert stats.saved_chars == len(original) - len(text) > 0
+    assert stats.saved_tokens == round(stats.saved_chars / 4)
+
+
+def test_summary_generator_normalizes_before_chunking():
+    mock_mgr = Mock(spec=ModelManager)
+    mock_mgr.default_client = Mock()
+    mock_mgr.default_client.invoke = Mock(return_value=Mock(content="Mocked summary"))
+    mock_mgr.default_client.ainvoke = AsyncMock(return_value=Mock(content="Mocked summary"))
+    generator = SummaryGenerator(mock_mgr, chunk_size=50)
+
+    result = generator.summarize("A hyphen-\nated    \ufb01le.\f1\n", "brief")
+    prompt = mock_mgr.default_client.ainvoke.call_args[0][0][0].content
+    assert prompt.endswith(":\n\nA hyphenated file.")
+    assert result.summary == "Mocked summary"
+    assert result.normalization.saved_chars > 0